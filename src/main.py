@@ -1,6 +1,7 @@
 from process import Process
 from priority_aging_scheduler import PrioritySchedulerWithAging
 from multi_level_scheduler import MultiLevelQueueScheduler
+from telemetry import Telemetry
 
 def get_priority_aging_input():
     """Gets user input for the Priority with Aging scheduler."""
@@ -109,14 +110,15 @@ def main():
     print("2. Multi-Level Queue Scheduling (RR/FCFS)")
     
     choice = input("Please choose the scheduler to run (1 or 2): ")
+    telemetry = Telemetry()
     
     if choice == '1':
         processes, context_switch, aging_interval = get_priority_aging_input()
-        scheduler = PrioritySchedulerWithAging(processes, context_switch, aging_interval)
+        scheduler = PrioritySchedulerWithAging(processes, context_switch, aging_interval, telemetry)
         print("\nRunning Preemptive Priority Scheduler with Aging...")
     elif choice == '2':
         processes, context_switch, time_quantum = get_multi_level_input()
-        scheduler = MultiLevelQueueScheduler(processes, context_switch, time_quantum)
+        scheduler = MultiLevelQueueScheduler(processes, context_switch, time_quantum, telemetry)
         print("\nRunning Multi-Level Queue Scheduler...")
     else:
         print("Invalid choice. Exiting.")
@@ -131,6 +133,11 @@ def main():
     scheduler.printGanttChart()
     scheduler.display_results_table()
 
+    telemetry_path = input("\nTelemetry CSV file (leave blank to skip): ").strip()
+    if telemetry_path:
+        telemetry.export_csv(telemetry_path)
+        print(f"Telemetry written to {telemetry_path}")
+
 if __name__ == "__main__":
     # hardcodedTests()
     main()
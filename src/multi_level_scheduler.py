@@ -8,9 +8,9 @@ class MultiLevelQueueScheduler(Scheduler):
     - Queue 1 (Foreground): Round-Robin (RR) scheduling with high priority.
     - Queue 2 (Background): First-Come, First-Serve (FCFS) scheduling with low priority.
     """
-    def __init__(self, processes, context_switch_time, time_quantum):
+    def __init__(self, processes, context_switch_time, time_quantum, telemetry=None):
         # Call the parent constructor
-        super().__init__(processes, context_switch_time)
+        super().__init__(processes, context_switch_time, telemetry)
         
         # Specific attributes for this scheduler
         self.time_quantum = time_quantum
@@ -31,6 +31,10 @@ class MultiLevelQueueScheduler(Scheduler):
         else:  # 1 is for Background (FCFS)
             self.fcfs_queue.append(process)
 
+    def _queue_lengths(self):
+        """Reports the RR and FCFS queues separately."""
+        return {'rr_queue': len(self.rr_queue), 'fcfs_queue': len(self.fcfs_queue)}
+
     def _select_next_process(self) -> Process | None:
         """
         Selects the next process to run. It gives absolute priority
@@ -108,6 +112,8 @@ class MultiLevelQueueScheduler(Scheduler):
                     p.remaining_burst_time -= 1
 
             # --- CPU ACTION ---
+            busy_before = self.cpu_busy_time
+            was_switching = self.is_context_switching
             if self.is_context_switching:
                 if self.current_time >= self.context_switch_end_time:
                     self.is_context_switching = False
@@ -143,6 +149,7 @@ class MultiLevelQueueScheduler(Scheduler):
                     self.is_idle = True
             
             self._update_wait_times_and_age()
+            self._record_telemetry(busy_before, was_switching)
         self._calculate_metrics()
 
         
\ No newline at end of file
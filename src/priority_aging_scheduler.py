@@ -2,8 +2,8 @@ from scheduler import Scheduler
 
 class PrioritySchedulerWithAging(Scheduler):
     """Implements a preemptive priority scheduler with an aging mechanism."""
-    def __init__(self, processes, context_switch_time, aging_interval):
-        super().__init__(processes, context_switch_time)
+    def __init__(self, processes, context_switch_time, aging_interval, telemetry=None):
+        super().__init__(processes, context_switch_time, telemetry)
         self.aging_interval = aging_interval
         self.ready_queue = sorted(self.ready_queue, key=lambda p: (p.current_priority, p.arrival_time))
         
@@ -39,6 +39,7 @@ class PrioritySchedulerWithAging(Scheduler):
                 if p.current_priority > 0:
                     p.current_priority -= 1
                     p.priority_history.append((self.current_time, p.current_priority))
+                    self.aging_events += 1
                     self.ready_queue.sort(key=lambda p: (p.current_priority, p.arrival_time))
 
     def display_results(self):
@@ -5,7 +5,7 @@ class Scheduler(ABC):
     Abstract base class for all scheduling algorithms.
     This final version uses a corrected simulation loop structure.
     """
-    def __init__(self, processes, context_switch_time):
+    def __init__(self, processes, context_switch_time, telemetry=None):
         self.processes = sorted(processes, key=lambda p: p.arrival_time)
         self.context_switch_time = context_switch_time
         
@@ -24,6 +24,10 @@ class Scheduler(ABC):
         self.is_idle = False
         self.context_switch_end_time = 0
 
+        # Optional time-series collector, sampled once per tick
+        self.telemetry = telemetry
+        self.aging_events = 0
+
     def run(self):
         """Main simulation loop with time incremented at the start."""
         
@@ -48,6 +52,8 @@ class Scheduler(ABC):
 
             # 3. EXECUTE CPU ACTION
             # Decide what the CPU is doing during the tick from t to t+1.
+            busy_before = self.cpu_busy_time
+            was_switching = self.is_context_switching
             if self.is_context_switching:
                 if self.current_time >= self.context_switch_end_time:
                     self.is_context_switching = False
@@ -75,9 +81,27 @@ class Scheduler(ABC):
                      self.is_idle = True
             
             self._update_wait_times_and_age()
+            self._record_telemetry(busy_before, was_switching)
 
         self._calculate_metrics()
 
+    def _queue_lengths(self):
+        """Returns the length of each ready queue, keyed by queue name."""
+        return {'ready_queue': len(self.ready_queue)}
+
+    def _record_telemetry(self, busy_before, was_switching):
+        """Samples queue depths and CPU state for the tick that just ran."""
+        if self.telemetry is None:
+            return
+        if self.cpu_busy_time > busy_before:
+            cpu_state = 'busy'
+        elif was_switching:
+            cpu_state = 'switch'
+        else:
+            cpu_state = 'idle'
+        self.telemetry.sample(self.current_time, self._queue_lengths(),
+                              len(self.blocked_queue), cpu_state, self.aging_events)
+
     def _start_context_switch(self, start_time):
         self.is_context_switching = True
         self.context_switch_end_time = start_time + self.context_switch_time
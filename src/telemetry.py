@@ -0,0 +1,115 @@
+import csv
+
+class Telemetry:
+    """
+    Collects per-tick time-series samples from a scheduler in bounded memory.
+
+    Samples are folded into at most `capacity` buckets. Each bucket starts out
+    covering `bucket_width` ticks; once every bucket is full, adjacent pairs are
+    merged and the width doubles. The whole run stays covered at a coarser
+    resolution, so memory does not grow with the length of the simulation.
+    """
+    def __init__(self, capacity=64, bucket_width=1):
+        if capacity < 2 or capacity % 2 != 0:
+            raise ValueError("capacity must be an even number >= 2")
+        if bucket_width < 1:
+            raise ValueError("bucket_width must be >= 1")
+
+        self.capacity = capacity
+        self.bucket_width = bucket_width
+        self.queue_names = None
+        self.buckets = []
+
+        # Cumulative aging counter seen at the previous sample
+        self._last_aging_events = 0
+
+    def sample(self, time, queue_lengths, blocked, cpu_state, aging_events):
+        """
+        Records a single tick.
+
+        queue_lengths maps a queue name to its length, blocked is the size of
+        the blocked queue, cpu_state is one of 'busy', 'idle' or 'switch' and
+        aging_events is the scheduler's cumulative aging counter.
+        """
+        if self.queue_names is None:
+            self.queue_names = list(queue_lengths)
+
+        if not self.buckets or self.buckets[-1]['ticks'] >= self.bucket_width:
+            if len(self.buckets) == self.capacity:
+                self._rollup()
+            self.buckets.append(self._new_bucket(time))
+
+        bucket = self.buckets[-1]
+        bucket['ticks'] += 1
+        for name in self.queue_names:
+            length = queue_lengths[name]
+            bucket['queues'][name][0] += length
+            bucket['queues'][name][1] = max(bucket['queues'][name][1], length)
+        bucket['blocked'][0] += blocked
+        bucket['blocked'][1] = max(bucket['blocked'][1], blocked)
+        bucket[cpu_state] += 1
+        bucket['aging'] += aging_events - self._last_aging_events
+        self._last_aging_events = aging_events
+
+    def _new_bucket(self, time):
+        return {
+            'start': time,
+            'ticks': 0,
+            'queues': {name: [0, 0] for name in self.queue_names},  # [sum, max]
+            'blocked': [0, 0],  # [sum, max]
+            'busy': 0,
+            'idle': 0,
+            'switch': 0,
+            'aging': 0,
+        }
+
+    def _rollup(self):
+        """Merges adjacent bucket pairs and doubles the bucket width."""
+        merged = []
+        for first, second in zip(self.buckets[0::2], self.buckets[1::2]):
+            bucket = self._new_bucket(first['start'])
+            for source in (first, second):
+                bucket['ticks'] += source['ticks']
+                for name in self.queue_names:
+                    bucket['queues'][name][0] += source['queues'][name][0]
+                    bucket['queues'][name][1] = max(bucket['queues'][name][1], source['queues'][name][1])
+                bucket['blocked'][0] += source['blocked'][0]
+                bucket['blocked'][1] = max(bucket['blocked'][1], source['blocked'][1])
+                for key in ('busy', 'idle', 'switch', 'aging'):
+                    bucket[key] += source[key]
+            merged.append(bucket)
+        self.buckets = merged
+        self.bucket_width *= 2
+
+    def rows(self):
+        """Returns (header, rows) with one row per bucket and one column per metric."""
+        names = self.queue_names or []
+        header = ["start_time", "end_time"]
+        for name in names:
+            header.extend([f"{name}_avg", f"{name}_max"])
+        header.extend(["blocked_avg", "blocked_max",
+                       "busy_frac", "idle_frac", "switch_frac", "aging_events"])
+
+        rows = []
+        for b in self.buckets:
+            ticks = b['ticks']
+            row = [b['start'], b['start'] + ticks]
+            for name in names:
+                row.extend([round(b['queues'][name][0] / ticks, 4), b['queues'][name][1]])
+            row.extend([
+                round(b['blocked'][0] / ticks, 4), b['blocked'][1],
+                round(b['busy'] / ticks, 4),
+                round(b['idle'] / ticks, 4),
+                round(b['switch'] / ticks, 4),
+                b['aging'],
+            ])
+            rows.append(row)
+        return header, rows
+
+    def export_csv(self, path):
+        """Writes the bucketed time series to a CSV file, one column per metric."""
+        header, rows = self.rows()
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)